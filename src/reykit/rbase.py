@@ -85,6 +85,8 @@ class Base(object):
     Base type.
     """
 
+    __slots__ = ()
+
 
 class StaticMeta(Base, type):
     """
@@ -10,19 +10,27 @@
 
 
 from typing import Any, Literal, TextIO, BinaryIO, overload, TYPE_CHECKING
+from collections.abc import Callable, Generator
 if TYPE_CHECKING:
     from _typeshed import OpenTextMode, OpenBinaryMode
 from io import TextIOBase, BufferedIOBase
+from functools import lru_cache, cached_property, partial
+from concurrent.futures import ThreadPoolExecutor
+from os import DirEntry, stat_result
+from stat import S_ISREG, S_ISDIR
 from os import (
     getcwd as os_getcwd,
-    walk as os_walk,
-    listdir as os_listdir,
+    scandir as os_scandir,
     makedirs as os_makedirs,
     renames as os_renames,
     remove as os_remove,
+    stat as os_stat,
+    fstat as os_fstat,
+    sep as os_sep
 )
 from os.path import (
     join as os_join,
+    realpath as os_realpath,
     relpath as os_relpath,
     isfile as os_isfile,
     isdir as os_isdir,
@@ -35,18 +43,28 @@ from os.path import (
     getatime as os_getatime,
     split as os_split,
     splitext as os_splitext,
-    splitdrive as os_splitdrive
+    splitdrive as os_splitdrive,
+    samefile as os_samefile
 )
-from shutil import copy as shutil_copy
-from pathlib import Path
-from hashlib import md5 as hashlib_md5
-from tomllib import loads as tomllib_loads
+try:
+    from os import copy_file_range as os_copy_file_range
+except ImportError:
+    os_copy_file_range = None
+try:
+    from os import fwalk as os_fwalk
+except ImportError:
+    os_fwalk = None
+from shutil import copyfile as shutil_copyfile, copymode as shutil_copymode, SameFileError
+from hashlib import md5 as hashlib_md5, new as hashlib_new, file_digest as hashlib_file_digest
+from tomllib import load as tomllib_load
 from json import JSONDecodeError
+from mmap import mmap, ACCESS_READ
+from re import compile as re_compile, escape as re_escape, S as RS
 from tempfile import TemporaryFile, TemporaryDirectory
+from time import time_ns
 
 from .rbase import Base, throw
 from .rdata import to_json
-from .rre import search, sub
 from .rsys import run_cmd
 
 
@@ -67,6 +85,7 @@ __all__ = (
     'compress',
     'decompress',
     'doc_to_docx',
+    'doc_to_docx_batch',
     'extract_docx_content',
     'extract_pdf_content',
     'extract_file_content'
@@ -80,6 +99,31 @@ type FileSourceStr = FilePath | FileText | TextIOBase
 type FileSourceBytes = FilePath | FileData | BufferedIOBase
 
 
+# Buffer size of open file, 128 KB.
+_IO_BUFFER = 1 << 17
+
+# Open function of fixed open modes, bind mode parameters once.
+_file_openers: dict[str, Callable[[str], TextIO | BinaryIO]] = {
+    **{
+        mode: partial(open, mode=mode, buffering=_IO_BUFFER, encoding='utf-8')
+        for mode in ('r', 'w', 'a')
+    },
+    **{
+        mode: partial(open, mode=mode, buffering=_IO_BUFFER)
+        for mode in ('rb', 'wb', 'ab')
+    }
+}
+
+# File size threshold of use memory map when hash, 1 MB.
+_MMAP_THRESHOLD = 1 << 20
+
+# Folder search cache skip window of recent modify time, 2 seconds, cover coarse timestamp file systems.
+_SEARCH_CACHE_RACY = 2 * 10 ** 9
+
+# Relative path of file in store.
+_re_store_relpath = re_compile(r'([0-9a-f]{2})/([0-9a-f]{2})/(\1\2[0-9a-f]{28,60})/[^/]+')
+
+
 def format_path(path: str | None = None) -> str:
     """
     Resolve relative path and replace to forward slash `/`.
@@ -98,9 +142,9 @@ def format_path(path: str | None = None) -> str:
     path = path or ''
 
     # Format.
-    path_obj = Path(path)
-    path_obj = path_obj.resolve()
-    path = path_obj.as_posix()
+    path = os_realpath(path)
+    if os_sep == '\\':
+        path = path.replace('\\', '/')
 
     return path
 
@@ -151,6 +195,38 @@ def get_md5(data: str | bytes) -> str:
     return md5
 
 
+def _hash_file(path: str, algorithm: str = 'md5') -> str:
+    """
+    Get file hash value, read file in chunks, memory usage not grow with file size.
+    When file is large, then map file to memory and hash pages directly.
+
+    Parameters
+    ----------
+    path : File path.
+    algorithm : Hash algorithm name of `hashlib`.
+
+    Returns
+    -------
+    Hash value.
+    """
+
+    # Get.
+    with open(path, 'rb') as file:
+
+        ## Large.
+        if os_fstat(file.fileno()).st_size > _MMAP_THRESHOLD:
+            with mmap(file.fileno(), 0, access=ACCESS_READ) as file_mmap:
+                hash_obj = hashlib_new(algorithm, file_mmap)
+
+        ## Small.
+        else:
+            hash_obj = hashlib_file_digest(file, algorithm)
+
+    value = hash_obj.hexdigest()
+
+    return value
+
+
 def make_dir(*paths: str, echo: bool = False) -> None:
     """
     Make directorys.
@@ -192,24 +268,14 @@ def find_relpath(abspath: str, relpath: str) -> str:
     """
 
     # Parameter.
-    level = 0
-    for char in relpath:
-        if char == '.':
-            level += 1
-        else:
-            break
-    strip_n = 0
-    for char in relpath[level:]:
-        if char in ('/', '\\'):
-            strip_n += 1
-        else:
-            break
+    rest = relpath.lstrip('.')
+    level = len(relpath) - len(rest)
+    relpath = rest.lstrip('/\\')
 
     # Convert.
     folder_path = abspath
     for _ in range(level):
         folder_path, _ = os_split(folder_path)
-    relpath = relpath[level + strip_n:]
     path = join_path(folder_path, relpath)
 
     return path
@@ -313,54 +379,402 @@ def read_toml(path: 'str | File') -> dict[str, Any]:
     Parameter dictionary.
     """
 
-    # Read.
+    # Parameter.
     match path:
 
         ## File path.
         case str():
-            file = File(path)
-            text = file.str
+            pass
 
         ## File object.
         case File():
-            text = file.str
+            path = path.path
+
+        ## Throw exception.
+        case _:
+            throw(TypeError, path)
 
     # Parse.
 
     ## Handle nan.
     parse_float = lambda float_str: None if float_str == "nan" else float_str
 
-    params = tomllib_loads(text, parse_float=parse_float)
+    with open(path, 'rb') as file:
+        params = tomllib_load(file, parse_float=parse_float)
 
     return params
 
 
+def _copy_file(source_path: str, target_path: str) -> None:
+    """
+    Copy file data and permission bits.
+    First try kernel copy `copy_file_range`, can clone on CoW file system, otherwise use `shutil.copyfile`.
+
+    Parameters
+    ----------
+    source_path : Source file path.
+    target_path : Target file path.
+    """
+
+    # Check.
+    try:
+        same_file = os_samefile(source_path, target_path)
+    except OSError:
+        same_file = False
+    if same_file:
+        throw(SameFileError, source_path, target_path)
+
+    # Kernel copy.
+    copied = False
+    if os_copy_file_range is not None:
+        with open(source_path, 'rb') as source_file, open(target_path, 'wb') as target_file:
+            source_fd = source_file.fileno()
+            target_fd = target_file.fileno()
+            try:
+                while True:
+                    copy_size = os_copy_file_range(source_fd, target_fd, 1 << 30)
+
+                    ## End, first call copy nothing of non empty file, then file system not supported.
+                    if copy_size == 0:
+                        if not copied:
+                            copied = os_fstat(source_fd).st_size == 0
+                        break
+
+                    copied = True
+
+            ## Not supported.
+            except OSError:
+                if copied:
+                    raise
+
+    # Copy.
+    if not copied:
+        shutil_copyfile(source_path, target_path)
+
+    # Permission.
+    shutil_copymode(source_path, target_path)
+
+
+def _iter_file_entries(path: str) -> Generator[DirEntry, None, None]:
+    """
+    Recursive iterate file entries in the folder path, type information read from directory.
+    Skip unreadable folders, same as `os.walk`.
+
+    Parameters
+    ----------
+    path : Folder path.
+
+    Returns
+    -------
+    File entry generator.
+    """
+
+    # Iterate.
+    dir_paths = [path]
+    while dir_paths:
+        dir_path = dir_paths.pop()
+        try:
+            entries = os_scandir(dir_path)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dir_paths.append(entry.path)
+                elif entry.is_file():
+                    yield entry
+
+
+def _get_folder_size(path: str) -> int:
+    """
+    Get folder byte size, include all files in it.
+    When supported, walk by directory descriptor, then `stat` only resolve file name in directory.
+
+    Parameters
+    ----------
+    path : Folder path.
+
+    Returns
+    -------
+    Folder byte size.
+    """
+
+    # Walk by directory descriptor, skip unreadable folders.
+    if os_fwalk is not None:
+        folder_size = 0
+        try:
+            for _, _, file_names, dir_fd in os_fwalk(path):
+                for file_name in file_names:
+                    try:
+                        file_stat = os_stat(file_name, dir_fd=dir_fd)
+
+                    ## Broken symbolic link.
+                    except FileNotFoundError:
+                        continue
+
+                    if S_ISREG(file_stat.st_mode):
+                        folder_size += file_stat.st_size
+
+        ## Unreadable folder path, subfolder errors are ignored by walk.
+        except OSError:
+            pass
+
+    # Walk by path.
+    else:
+        entries = _iter_file_entries(path)
+        folder_size = sum(
+            entry.stat().st_size
+            for entry in entries
+        )
+
+    return folder_size
+
+
+def _get_folder_size_parallel(path: str) -> int:
+    """
+    Get folder byte size, include all files in it.
+    When there are multiple subfolders, then walk them in parallel by threads, hide `stat` latency of slow file system.
+
+    Parameters
+    ----------
+    path : Folder path.
+
+    Returns
+    -------
+    Folder byte size.
+    """
+
+    # Top level.
+    folder_size = 0
+    dir_paths = []
+    with os_scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                dir_paths.append(entry.path)
+            elif entry.is_file():
+                folder_size += entry.stat().st_size
+
+    # Subfolder.
+
+    ## Few subfolders, thread start cost more than walk.
+    if len(dir_paths) < 4:
+        folder_size += sum(map(_get_folder_size, dir_paths))
+
+    ## Parallel.
+    else:
+        with ThreadPoolExecutor(min(32, len(dir_paths))) as executor:
+            folder_size += sum(executor.map(_get_folder_size, dir_paths))
+
+    return folder_size
+
+
+def _iter_paths(
+    path: str,
+    target: Literal['all', 'file', 'folder'] = 'all',
+    recursion: bool = False,
+    matcher: Callable[[str], object] | None = None
+) -> Generator[str, None, None]:
+    """
+    Iterate the path of files and folders in the folder path.
+
+    Parameters
+    ----------
+    path : Folder path.
+    target : Target data.
+        - `Literal['all']`: Return file and folder path.
+        - `Literal['file']`: Return file path.
+        - `Literal['folder']`: Return folder path.
+    recursion : Is recursion directory.
+    matcher : Judge function of entry name, only return path when it return true value.
+        - `None`: Return all path.
+
+    Returns
+    -------
+    Path generator.
+    """
+
+    # Recursive.
+    if recursion:
+        dir_paths = [path]
+        while dir_paths:
+            dir_path = dir_paths.pop()
+            path_prefix = dir_path.rstrip('/')
+
+            ## Skip unreadable subfolder, same as `os.walk`, only raise for the folder path.
+            try:
+                entries = os_scandir(dir_path)
+            except OSError:
+                if dir_path == path:
+                    raise
+                continue
+
+            with entries:
+                for entry in entries:
+                    entry_path = f'{path_prefix}/{entry.name}'
+                    is_dir = entry.is_dir()
+                    if is_dir and not entry.is_symlink():
+                        dir_paths.append(entry_path)
+                    if (
+                        matcher is not None
+                        and not matcher(entry.name)
+                    ):
+                        continue
+                    match target:
+                        case 'all':
+                            yield entry_path
+                        case 'file':
+                            if entry.is_file():
+                                yield entry_path
+                        case 'folder':
+                            if is_dir:
+                                yield entry_path
+
+    # Non recursive.
+    else:
+        dir_path = path.rstrip('/')
+        with os_scandir(path) as entries:
+            if matcher is not None:
+                entries = (
+                    entry
+                    for entry in entries
+                    if matcher(entry.name)
+                )
+            match target:
+                case 'all':
+                    for entry in entries:
+                        yield f'{dir_path}/{entry.name}'
+                case 'file':
+                    for entry in entries:
+                        if entry.is_file():
+                            yield f'{dir_path}/{entry.name}'
+                case 'folder':
+                    for entry in entries:
+                        if entry.is_dir():
+                            yield f'{dir_path}/{entry.name}'
+
+
+@lru_cache(128)
+def _get_name_matcher(pattern: str) -> Callable[[str], object]:
+    """
+    Get function of judge whether file name match regular expression, compile once.
+    When pattern has no regular expression metacharacter, then use substring judgment.
+
+    Parameters
+    ----------
+    pattern : Regular expression pattern.
+
+    Returns
+    -------
+    Judge function, return true value when matched.
+    """
+
+    # Literal.
+    if re_escape(pattern) == pattern:
+        matcher = lambda name: pattern in name
+
+    # Regular.
+    else:
+        matcher = re_compile(pattern, RS).search
+
+    return matcher
+
+
+@lru_cache(1024)
+def _search_folder(
+    path: str,
+    mtime: int,
+    pattern: str,
+    target: Literal['all', 'file', 'folder']
+) -> tuple[str, ...]:
+    """
+    Search file name by regular expression in the folder path, non recursive, cache result.
+    The folder modify time changes when entries are added, removed or renamed, so it invalidates the cache,
+    caller must not use it when modify time is recent, because coarse timestamps may not change within one tick.
+
+    Parameters
+    ----------
+    path : Folder path.
+    mtime : Folder modify timestamp in nanoseconds, part of cache key.
+    pattern : Regular expression pattern.
+    target : Target data.
+
+    Returns
+    -------
+    Searched paths.
+    """
+
+    # Search.
+    matcher = _get_name_matcher(pattern)
+    match_paths = tuple(_iter_paths(path, target, matcher=matcher))
+
+    return match_paths
+
+
 class File(Base):
     """
     File type.
     """
 
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, cache_stat: bool = False) -> None:
         """
         Build instance attributes.
 
         Parameters
         ----------
         path : File path.
+        cache_stat : Whether to cache file status, then status properties share one `stat` call until method `refresh`.
         """
 
         # Set attribute.
         self.path = format_path(path)
+        self.cache_stat = cache_stat
+        self._stat: stat_result | None = None
+
+
+    def _get_stat(self) -> stat_result:
+        """
+        Get file status, when cache is enabled, then use cached status.
+
+        Returns
+        -------
+        File status.
+        """
+
+        # Cache.
+        if self._stat is not None:
+            return self._stat
+
+        # Get.
+        file_stat = os_stat(self.path)
+        if self.cache_stat:
+            self._stat = file_stat
+
+        return file_stat
+
+
+    def refresh(self) -> None:
+        """
+        Clear cached file status.
+        """
+
+        # Clear.
+        self._stat = None
 
 
     @overload
-    def open(self, mode: 'OpenBinaryMode' = 'wb+') -> BinaryIO: ...
+    def open(self, mode: 'OpenBinaryMode' = 'wb+', *, buffering: int | None = None) -> BinaryIO: ...
 
     @overload
-    def open(self, mode: 'OpenTextMode', encode: str = 'utf-8') -> TextIO: ...
+    def open(self, mode: 'OpenTextMode', encode: str = 'utf-8', *, buffering: int | None = None) -> TextIO: ...
 
-    def open(self, mode: 'OpenTextMode | OpenBinaryMode' = 'wb+', encode: str = 'utf-8') -> TextIO | BinaryIO:
+    def open(
+        self,
+        mode: 'OpenTextMode | OpenBinaryMode' = 'wb+',
+        encode: str = 'utf-8',
+        *,
+        buffering: int | None = None
+    ) -> TextIO | BinaryIO:
         """
         Open file.
 
@@ -368,6 +782,9 @@ class File(Base):
         ----------
         mode : Open mode.
         encode : Encoding method.
+        buffering : Buffer size.
+            - `None`: Use 128 KB.
+            - `0`: Unbuffered, only binary mode.
 
         Returns
         -------
@@ -377,9 +794,11 @@ class File(Base):
         # Parameter.
         if 'b' in mode:
             encode = None
+        if buffering is None:
+            buffering = _IO_BUFFER
 
         # Open.
-        io = open(self.path, mode, encoding=encode)
+        io = open(self.path, mode, buffering, encode)
 
         return io
 
@@ -404,8 +823,9 @@ class File(Base):
         """
 
         # Open.
-        if name in ('r', 'w', 'a', 'rb', 'wb', 'ab'):
-            io = self.open(name)
+        opener = _file_openers.get(name)
+        if opener is not None:
+            io = opener(self.path)
             return io
 
         # Throw exception.
@@ -433,16 +853,17 @@ class File(Base):
         File data.
         """
 
-        # Parameter.
-        match type_:
-            case 'bytes':
-                mode = 'rb'
-            case 'str':
-                mode = 'r'
-
         # Read.
-        with self.open(mode) as file:
-            content = file.read()
+        with self.open('rb', buffering=0) as file:
+            content = file.readall()
+
+        # Decode.
+        if type_ == 'str':
+            content = content.decode()
+
+            ## Universal newline.
+            if '\r' in content:
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
 
         return content
 
@@ -471,19 +892,23 @@ class File(Base):
             mode = 'a'
         else:
             mode = 'w'
-        if type(data) in (bytes, bytearray):
-            mode += 'b'
+        match data:
+            case bytes() | bytearray():
+                mode += 'b'
+            case str():
+                pass
 
-        ## Convert data to string.
-        if type(data) not in (str, bytes, bytearray):
-            try:
-                data = to_json(data)
-            except (JSONDecodeError, TypeError):
-                data = str(data)
+            ## Convert data to string.
+            case _:
+                try:
+                    data = to_json(data)
+                except (JSONDecodeError, TypeError):
+                    data = str(data)
 
         # Write.
         with self.open(mode) as file:
             file.write(data)
+        self.refresh()
 
 
     def copy(self, path: str) -> None:
@@ -495,11 +920,12 @@ class File(Base):
         path : Copy path.
         """
 
+        # Parameter.
+        if os_isdir(path):
+            path = os_join(path, self.name_suffix)
+
         # Copy.
-        shutil_copy(
-            self.path,
-            path
-        )
+        _copy_file(self.path, path)
 
 
     def move(self, path: str) -> None:
@@ -516,6 +942,7 @@ class File(Base):
             self.path,
             path
         )
+        self.refresh()
 
 
     def rename(self, name: str) -> str:
@@ -555,6 +982,8 @@ class File(Base):
             run_cmd(command)
             os_remove(self.path)
 
+        self.refresh()
+
 
     @property
     def str(self) -> str:
@@ -588,7 +1017,7 @@ class File(Base):
         return file_bytes
 
 
-    @property
+    @cached_property
     def name_suffix(self) -> str:
         """
         Return file name with suffix.
@@ -604,7 +1033,7 @@ class File(Base):
         return file_name_suffix
 
 
-    @property
+    @cached_property
     def name(self) -> str:
         """
         Return file name not with suffix.
@@ -620,7 +1049,7 @@ class File(Base):
         return file_name
 
 
-    @property
+    @cached_property
     def suffix(self) -> str:
         """
         Return file suffix.
@@ -636,7 +1065,7 @@ class File(Base):
         return file_suffix
 
 
-    @property
+    @cached_property
     def dir(self) -> str:
         """
         Return file directory.
@@ -652,7 +1081,7 @@ class File(Base):
         return file_dir
 
 
-    @property
+    @cached_property
     def drive(self) -> str:
         """
         Return file drive letter.
@@ -679,7 +1108,7 @@ class File(Base):
         """
 
         # Get.
-        file_size = os_getsize(self.path)
+        file_size = self._get_stat().st_size
 
         return file_size
 
@@ -695,7 +1124,7 @@ class File(Base):
         """
 
         # Get.
-        file_ctime = os_getctime(self.path)
+        file_ctime = self._get_stat().st_ctime
 
         return file_ctime
 
@@ -711,7 +1140,7 @@ class File(Base):
         """
 
         # Get.
-        file_mtime = os_getmtime(self.path)
+        file_mtime = self._get_stat().st_mtime
 
         return file_mtime
 
@@ -727,13 +1156,13 @@ class File(Base):
         """
 
         # Get.
-        file_atime = os_getatime(self.path)
+        file_atime = self._get_stat().st_atime
 
         return file_atime
 
 
     @property
-    def md5(self) -> float:
+    def md5(self) -> str:
         """
         Return file MD5 value.
 
@@ -743,8 +1172,7 @@ class File(Base):
         """
 
         # Get.
-        file_bytes = self.bytes
-        file_md5 = get_md5(file_bytes)
+        file_md5 = _hash_file(self.path)
 
         return file_md5
 
@@ -776,7 +1204,11 @@ class File(Base):
         """
 
         # Judge.
-        file_exist = os_isfile(self.path)
+        try:
+            file_stat = self._get_stat()
+        except (OSError, ValueError):
+            return False
+        file_exist = S_ISREG(file_stat.st_mode)
 
         return file_exist
 
@@ -841,15 +1273,33 @@ class File(Base):
 
         # Parameter.
         match value:
+
+            ## Text newlines are normalized when read, so search in text.
+            case str() if (
+                '\n' in value
+                or '\r' in value
+            ):
+                judge = value in self.str
+                return judge
+
             case str():
-                content = self.str
+                value = value.encode()
             case bytes() | bytearray():
-                content = self.bytes
+                pass
             case _:
                 throw(TypeError, value)
 
         # Judge.
-        judge = value in content
+        with open(self.path, 'rb') as file:
+
+            ## Empty file, cannot map.
+            if os_fstat(file.fileno()).st_size == 0:
+                judge = value == b''
+
+            ## Search in mapped pages.
+            else:
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as file_mmap:
+                    judge = file_mmap.find(value) != -1
 
         return judge
 
@@ -862,8 +1312,10 @@ class Folder(Base):
     Folder type.
     """
 
+    __slots__ = ('path', '_path_prefix', 'cache_stat', '_stat')
+
 
-    def __init__(self, path: str | None = None) -> None:
+    def __init__(self, path: str | None = None, cache_stat: bool = False) -> None:
         """
         Build instance attributes.
 
@@ -871,10 +1323,44 @@ class Folder(Base):
         ----------
         path : Folder path.
             - `None`: Use working directory.
+        cache_stat : Whether to cache folder status, then status properties share one `stat` call until method `refresh`.
         """
 
         # Set attribute.
         self.path = format_path(path)
+        self._path_prefix = self.path if self.path.endswith('/') else self.path + '/'
+        self.cache_stat = cache_stat
+        self._stat: stat_result | None = None
+
+
+    def _get_stat(self) -> stat_result:
+        """
+        Get folder status, when cache is enabled, then use cached status.
+
+        Returns
+        -------
+        Folder status.
+        """
+
+        # Cache.
+        if self._stat is not None:
+            return self._stat
+
+        # Get.
+        folder_stat = os_stat(self.path)
+        if self.cache_stat:
+            self._stat = folder_stat
+
+        return folder_stat
+
+
+    def refresh(self) -> None:
+        """
+        Clear cached folder status.
+        """
+
+        # Clear.
+        self._stat = None
 
 
     def paths(
@@ -899,56 +1385,34 @@ class Folder(Base):
         """
 
         # Get paths.
-        paths: list[str] = []
+        paths = list(self.iter_paths(target, recursion))
 
-        ## Recursive.
-        if recursion:
-            obj_walk = os_walk(self.path)
-            match target:
-                case 'all':
-                    targets_path = [
-                        join_path(path, file_name)
-                        for path, folders_name, files_name in obj_walk
-                        for file_name in files_name + folders_name
-                    ]
-                    paths.extend(targets_path)
-                case 'file':
-                    targets_path = [
-                        join_path(path, file_name)
-                        for path, _, files_name in obj_walk
-                        for file_name in files_name
-                    ]
-                    paths.extend(targets_path)
-                case 'folder':
-                    targets_path = [
-                        join_path(path, folder_name)
-                        for path, folders_name, _ in obj_walk
-                        for folder_name in folders_name
-                    ]
-                    paths.extend(targets_path)
+        return paths
 
-        ## Non recursive.
-        else:
-            names = os_listdir(self.path)
-            match target:
-                case 'all':
-                    for name in names:
-                        target_path = join_path(self.path, name)
-                        paths.append(target_path)
-                case 'file':
-                    for name in names:
-                        target_path = join_path(self.path, name)
-                        is_file = os_isfile(target_path)
-                        if is_file:
-                            paths.append(target_path)
-                case 'folder':
-                    for name in names:
-                        target_path = join_path(self.path, name)
-                        is_dir = os_isdir(target_path)
-                        if is_dir:
-                            paths.append(target_path)
 
-        return paths
+    def iter_paths(
+        self,
+        target: Literal['all', 'file', 'folder'] = 'all',
+        recursion: bool = False
+    ) -> Generator[str, None, None]:
+        """
+        Iterate the path of files and folders in the folder path, lazy walk directory.
+
+        Parameters
+        ----------
+        target : Target data.
+            - `Literal['all']`: Return file and folder path.
+            - `Literal['file']`: Return file path.
+            - `Literal['folder']`: Return folder path.
+        recursion : Is recursion directory.
+
+        Returns
+        -------
+        Generator of path.
+        """
+
+        # Iterate.
+        yield from _iter_paths(self.path, target, recursion)
 
 
     @overload
@@ -956,7 +1420,9 @@ class Folder(Base):
         self,
         pattern: str = '',
         target: Literal['all', 'file', 'folder'] = 'all',
-        recursion: bool = False
+        recursion: bool = False,
+        *,
+        cache: bool = False
     ) -> str | None: ...
 
     @overload
@@ -966,7 +1432,8 @@ class Folder(Base):
         target: Literal['all', 'file', 'folder'] = 'all',
         recursion: bool = False,
         *,
-        first: Literal[False]
+        first: Literal[False],
+        cache: bool = False
     ) -> list[str]: ...
 
     def search(
@@ -974,7 +1441,8 @@ class Folder(Base):
         pattern: str = '',
         target: Literal['all', 'file', 'folder'] = 'all',
         recursion: bool = False,
-        first: bool = True
+        first: bool = True,
+        cache: bool = False
     ) -> str | list[str] | None:
         """
         Search file name by regular expression.
@@ -988,32 +1456,74 @@ class Folder(Base):
             - `Literal['folder']`: Return folder path.
         recursion : Is recursion directory.
         first : Whether return first search path, otherwise return all search path.
+        cache : Whether to cache non recursive result by folder modify time.
+            Folder modified within the last 2 seconds is not cached, because coarse timestamps may not change on every entry change.
 
         Returns
         -------
         Searched path or null.
         """
 
+        # Non recursive, cache by folder modify time.
+        if (
+            cache
+            and not recursion
+        ):
+            folder_mtime = os_stat(self.path).st_mtime_ns
+            if time_ns() - folder_mtime > _SEARCH_CACHE_RACY:
+                match_paths = _search_folder(self.path, folder_mtime, pattern, target)
+                if first:
+                    if match_paths != ():
+                        return match_paths[0]
+                else:
+                    return list(match_paths)
+                return
+
         # Get paths.
-        file_paths = self.paths(target, recursion)
+        matcher = _get_name_matcher(pattern)
+        match_paths = _iter_paths(self.path, target, recursion, matcher)
 
         # First.
         if first:
-            for path in file_paths:
-                name = os_basename(path)
-                result = search(pattern, name)
-                if result is not None:
-                    return path
+            return next(match_paths, None)
 
         # All.
         else:
-            match_paths: list[str] = []
-            for path in file_paths:
-                name = os_basename(path)
-                result = search(pattern, name)
-                if result is not None:
-                    match_paths.append(path)
-            return match_paths
+            return list(match_paths)
+
+
+    def md5_all(self, recursion: bool = True) -> dict[str, str]:
+        """
+        Get MD5 value of files in the folder, hash multiple files in parallel by threads.
+
+        Parameters
+        ----------
+        recursion : Is recursion directory.
+
+        Returns
+        -------
+        Dictionary of file path and MD5 value.
+        """
+
+        # Parameter.
+        file_paths = self.paths('file', recursion)
+
+        # Get.
+
+        ## Few files, thread start cost more than hash.
+        if len(file_paths) < 16:
+            md5_dict = {
+                path: _hash_file(path)
+                for path in file_paths
+            }
+
+        ## Parallel.
+        else:
+            with ThreadPoolExecutor() as executor:
+                file_md5s = executor.map(_hash_file, file_paths)
+                md5_dict = dict(zip(file_paths, file_md5s))
+
+        return md5_dict
 
 
     def join(self, path: str) -> str:
@@ -1023,6 +1533,8 @@ class Folder(Base):
         Parameters
         ----------
         path : Relative path.
+            - Plain single name: Concatenate to folder path, not resolve this name.
+            - Other: Join and resolve path.
 
         Returns
         -------
@@ -1030,9 +1542,20 @@ class Folder(Base):
         """
 
         # Join.
-        path = join_path(self.path, path)
 
-        return path
+        ## Concatenate, plain single name.
+        if (
+            path not in ('', '.', '..')
+            and '/' not in path
+            and '\\' not in path
+        ):
+            joined_path = self._path_prefix + path
+
+        ## Resolve.
+        else:
+            joined_path = join_path(self.path, path)
+
+        return joined_path
 
 
     def make(self, echo: bool = False) -> None:
@@ -1052,6 +1575,7 @@ class Folder(Base):
         # Not exist.
         else:
             os_makedirs(self.path)
+            self.refresh()
             text = 'Directory creation complete | %s' % self.path
 
         # Report.
@@ -1073,6 +1597,7 @@ class Folder(Base):
             self.path,
             path
         )
+        self.refresh()
 
 
     def rename(self, name: str) -> str:
@@ -1156,12 +1681,7 @@ class Folder(Base):
         """
 
         # Get.
-        file_paths = self.paths('file', True)
-        file_sizes = [
-            os_getsize(path)
-            for path in file_paths
-        ]
-        folder_size = sum(file_sizes)
+        folder_size = _get_folder_size_parallel(self.path)
 
         return folder_size
 
@@ -1177,7 +1697,7 @@ class Folder(Base):
         """
 
         # Get.
-        folder_ctime = os_getctime(self.path)
+        folder_ctime = self._get_stat().st_ctime
 
         return folder_ctime
 
@@ -1193,7 +1713,7 @@ class Folder(Base):
         """
 
         # Get.
-        folder_mtime = os_getmtime(self.path)
+        folder_mtime = self._get_stat().st_mtime
 
         return folder_mtime
 
@@ -1209,7 +1729,7 @@ class Folder(Base):
         """
 
         # Get.
-        folder_atime = os_getatime(self.path)
+        folder_atime = self._get_stat().st_atime
 
         return folder_atime
 
@@ -1224,7 +1744,11 @@ class Folder(Base):
         """
 
         # Judge.
-        folder_exist = os_isdir(self.path)
+        try:
+            folder_stat = self._get_stat()
+        except (OSError, ValueError):
+            return False
+        folder_exist = S_ISDIR(folder_stat.st_mode)
 
         return folder_exist
 
@@ -1338,7 +1862,7 @@ class TempFile(Base):
         self.file.seek(0)
 
 
-    @property
+    @cached_property
     def name_suffix(self) -> str:
         """
         Return file name with suffix.
@@ -1354,7 +1878,7 @@ class TempFile(Base):
         return file_name_suffix
 
 
-    @property
+    @cached_property
     def name(self) -> str:
         """
         Return file name not with suffix.
@@ -1370,7 +1894,7 @@ class TempFile(Base):
         return file_name
 
 
-    @property
+    @cached_property
     def suffix(self) -> str:
         """
         Return file suffix.
@@ -1386,7 +1910,7 @@ class TempFile(Base):
         return file_suffix
 
 
-    @property
+    @cached_property
     def dir(self) -> str:
         """
         Return file directory.
@@ -1402,7 +1926,7 @@ class TempFile(Base):
         return file_dir
 
 
-    @property
+    @cached_property
     def drive(self) -> str:
         """
         Return file drive letter.
@@ -1483,7 +2007,7 @@ class TempFile(Base):
 
 
     @property
-    def md5(self) -> float:
+    def md5(self) -> str:
         """
         Return file MD5 value.
 
@@ -1493,8 +2017,17 @@ class TempFile(Base):
         """
 
         # Get.
-        file_bytes = self.read()
-        file_md5 = get_md5(file_bytes)
+
+        ## Bytes.
+        if 'b' in self.file.mode:
+            self.file.seek(0)
+            hash_obj = hashlib_file_digest(self.file, 'md5')
+            file_md5 = hash_obj.hexdigest()
+
+        ## String.
+        else:
+            file_str = self.read()
+            file_md5 = get_md5(file_str)
 
         return file_md5
 
@@ -1544,11 +2077,21 @@ class TempFile(Base):
         Judge result.
         """
 
-        # Parameter.
-        content = self.read()
-
         # Judge.
-        judge = value in content
+
+        ## Bytes, search in mapped pages.
+        if 'b' in self.file.mode:
+            self.file.flush()
+            if os_fstat(self.file.fileno()).st_size == 0:
+                judge = value == b''
+            else:
+                with mmap(self.file.fileno(), 0, access=ACCESS_READ) as file_mmap:
+                    judge = file_mmap.find(value) != -1
+
+        ## String.
+        else:
+            content = self.read()
+            judge = value in content
 
         return judge
 
@@ -1570,6 +2113,8 @@ class TempFolder(Base):
     Temporary folder type.
     """
 
+    __slots__ = ('folder', 'path', '_path_prefix')
+
 
     def __init__(self, dir_: str | None = None) -> None:
         """
@@ -1583,6 +2128,7 @@ class TempFolder(Base):
         # Set attribute.
         self.folder = TemporaryDirectory(dir=dir_)
         self.path = format_path(self.folder.name)
+        self._path_prefix = self.path if self.path.endswith('/') else self.path + '/'
 
 
     def paths(
@@ -1607,54 +2153,7 @@ class TempFolder(Base):
         """
 
         # Get paths.
-        paths = []
-
-        ## Recursive.
-        if recursion:
-            obj_walk = os_walk(self.path)
-            match target:
-                case 'all':
-                    targets_path = [
-                        join_path(path, file_name)
-                        for path, folders_name, files_name in obj_walk
-                        for file_name in files_name + folders_name
-                    ]
-                    paths.extend(targets_path)
-                case 'file':
-                    targets_path = [
-                        join_path(path, file_name)
-                        for path, _, files_name in obj_walk
-                        for file_name in files_name
-                    ]
-                    paths.extend(targets_path)
-                case 'all' | 'folder':
-                    targets_path = [
-                        join_path(path, folder_name)
-                        for path, folders_name, _ in obj_walk
-                        for folder_name in folders_name
-                    ]
-                    paths.extend(targets_path)
-
-        ## Non recursive.
-        else:
-            names = os_listdir(self.path)
-            match target:
-                case 'all':
-                    for name in names:
-                        target_path = join_path(self.path, name)
-                        paths.append(target_path)
-                case 'file':
-                    for name in names:
-                        target_path = join_path(self.path, name)
-                        is_file = os_isfile(target_path)
-                        if is_file:
-                            paths.append(target_path)
-                case 'folder':
-                    for name in names:
-                        target_path = join_path(self.path, name)
-                        is_dir = os_isdir(target_path)
-                        if is_dir:
-                            paths.append(target_path)
+        paths = list(_iter_paths(self.path, target, recursion))
 
         return paths
 
@@ -1702,26 +2201,24 @@ class TempFolder(Base):
         Searched path or null.
         """
 
+        # Parameter.
+
+        ## Empty pattern, match all.
+        if pattern == '':
+            matcher = None
+        else:
+            matcher = _get_name_matcher(pattern)
+
         # Get paths.
-        file_paths = self.paths(target, recursion)
+        match_paths = _iter_paths(self.path, target, recursion, matcher)
 
         # First.
         if first:
-            for path in file_paths:
-                name = os_basename(path)
-                result = search(pattern, name)
-                if result is not None:
-                    return path
+            return next(match_paths, None)
 
         # All.
         else:
-            match_paths: list[str] = []
-            for path in file_paths:
-                name = os_basename(path)
-                result = search(pattern, name)
-                if result is not None:
-                    match_paths.append(path)
-            return match_paths
+            return list(match_paths)
 
 
     def join(self, path: str) -> str:
@@ -1731,6 +2228,8 @@ class TempFolder(Base):
         Parameters
         ----------
         path : Relative path.
+            - Plain single name: Concatenate to folder path, not resolve this name.
+            - Other: Join and resolve path.
 
         Returns
         -------
@@ -1738,9 +2237,20 @@ class TempFolder(Base):
         """
 
         # Join.
-        join_path = join_path(self.path, path)
 
-        return join_path
+        ## Concatenate, plain single name.
+        if (
+            path not in ('', '.', '..')
+            and '/' not in path
+            and '\\' not in path
+        ):
+            joined_path = self._path_prefix + path
+
+        ## Resolve.
+        else:
+            joined_path = join_path(self.path, path)
+
+        return joined_path
 
 
     @property
@@ -1802,12 +2312,7 @@ class TempFolder(Base):
         """
 
         # Get.
-        file_paths = self.paths('file', True)
-        file_sizes = [
-            os_getsize(path)
-            for path in file_paths
-        ]
-        folder_size = sum(file_sizes)
+        folder_size = _get_folder_size_parallel(self.path)
 
         return folder_size
 
@@ -1930,17 +2435,26 @@ class FileStore(Base):
     """
 
 
-    def __init__(self, path: str = 'file') -> None:
+    def __init__(
+        self,
+        path: str = 'file',
+        algorithm: Literal['md5', 'sha256', 'blake3'] = 'md5'
+    ) -> None:
         """
         Build instance attributes.
 
         Parameters
         ----------
         path : Root directory path.
+        algorithm : File hash algorithm of store addressing.
+            - `Literal['md5']`: MD5, compatible with stores created by previous versions.
+            - `Literal['sha256']`: SHA-256, accelerated by SHA-NI through OpenSSL.
+            - `Literal['blake3']`: BLAKE3, multi-threaded SIMD hash, need package `blake3`.
         """
 
         # Set attribute.
         self.folder = Folder(path)
+        self.algorithm = algorithm
 
         # Make directory.
         self.__make_dir()
@@ -1948,38 +2462,80 @@ class FileStore(Base):
 
     def __make_dir(self) -> None:
         """
-        Make cache directory and subdirectories.
-        When root directory exists, then not make.
+        Make cache root directory.
+        Subdirectories are made when storing file.
         """
 
-        # Exist.
-        if self.folder:
-            return
+        # Make.
+        self.folder.make()
+
+
+    def get_hash(self, source: FileSourceBytes) -> str:
+        """
+        Get file hash value of store addressing.
+
+        Parameters
+        ----------
+        source : Source file path or file data.
+
+        Returns
+        -------
+        File hash value.
+        """
+
+        # Get.
+        match self.algorithm:
+
+            ## BLAKE3.
+            case 'blake3':
+                from blake3 import blake3
+                if type(source) == str:
+                    hash_obj = blake3(max_threads=blake3.AUTO)
+                    hash_obj.update_mmap(source)
+                else:
+                    file_bytes = read_file_bytes(source)
+                    hash_obj = blake3(file_bytes)
+                file_hash = hash_obj.hexdigest(16)
+
+            ## Hashlib.
+            case _:
+                if type(source) == str:
+                    file_hash = _hash_file(source, self.algorithm)
+                else:
+                    file_bytes = read_file_bytes(source)
+                    hash_obj = hashlib_new(self.algorithm, file_bytes)
+                    file_hash = hash_obj.hexdigest()
+
+        return file_hash
+
+
+    def __get_stored_hash(self, path: str) -> str | None:
+        """
+        Get hash value from the path of file in store, without reading file.
+
+        Parameters
+        ----------
+        path : File path.
+
+        Returns
+        -------
+        File hash value or not file in store.
+        """
 
         # Parameter.
-        chars = '0123456789abcdef'
-        subdir_names = [
-            char1 + char2
-            for char1 in chars
-            for char2 in chars
-        ]
-        paths = [self.folder.path]
-        paths.extend(
-            [
-                self.folder + name
-                for name in subdir_names
-            ]
-        )
-        paths.extend(
-            [
-                self.folder + f'{name1}/{name2}'
-                for name1 in subdir_names
-                for name2 in subdir_names
-            ]
-        )
+        path = format_path(path)
+        path_prefix = self.folder._path_prefix
 
-        # Make.
-        make_dir(*paths)
+        # Not in store.
+        if not path.startswith(path_prefix):
+            return
+
+        # Parse.
+        relpath = path[len(path_prefix):]
+        result = _re_store_relpath.fullmatch(relpath)
+        if result is not None:
+            file_hash = result[3]
+            return file_hash
 
 
     def index(self, md5: str, name: str | None = None, copy: bool = False) -> str | None:
@@ -1988,10 +2544,10 @@ class FileStore(Base):
 
         Parameters
         ----------
-        md5 : File MD5 value.
+        md5 : File hash value, keyword name kept for compatibility.
         name : File name.
-            - `None`: Use MD5 value.
-        copy : Do you want to copy file when exist MD5 value file and not exist file name.
+            - `None`: Use hash value.
+        copy : Do you want to copy file when exist hash value file and not exist file name.
 
         Returns
         -------
@@ -2001,13 +2557,13 @@ class FileStore(Base):
         # Parameter.
         name = name or md5
 
-        # Not exist md5.
-        md5_relpath = f'{md5[:2]}/{md5[2:4]}/{md5}'
-        if md5_relpath not in self.folder:
+        # Not exist hash.
+        hash_relpath = f'{md5[:2]}/{md5[2:4]}/{md5}'
+        if hash_relpath not in self.folder:
             return
 
-        # Exist md5.
-        file_relpath = f'{md5_relpath}/{name}'
+        # Exist hash.
+        file_relpath = f'{hash_relpath}/{name}'
         file_path = self.folder + file_relpath
 
         ## Exist file.
@@ -2016,11 +2572,10 @@ class FileStore(Base):
 
         ## Copy file.
         elif copy:
-            md5_path = self.folder + md5_relpath
-            md5_folder = Folder(md5_path)
-            md5_file_path = md5_folder.search(target='file')
-            file = File(md5_file_path)
-            file.copy(file_path)
+            hash_path = self.folder + hash_relpath
+            hash_folder = Folder(hash_path)
+            hash_file_path = hash_folder.search(target='file')
+            _copy_file(hash_file_path, file_path)
             return file_path
 
 
@@ -2032,7 +2587,7 @@ class FileStore(Base):
         ----------
         source : Source file path or file data.
         name : File name.
-            - `None`: Use MD5 value.
+            - `None`: Use hash value.
         delete : When source is file path, whether delete original file.
 
         Returns
@@ -2041,13 +2596,17 @@ class FileStore(Base):
         """
 
         # Parameter.
-        file_bytes = read_file_bytes(source)
-        file_md5 = get_md5(file_bytes)
-        name = name or file_md5
-        delete = delete and type(source) == str
+        is_path = type(source) == str
+        if is_path:
+            file_hash = self.__get_stored_hash(source) or self.get_hash(source)
+        else:
+            source = read_file_bytes(source)
+            file_hash = self.get_hash(source)
+        name = name or file_hash
+        delete = delete and is_path
 
         # Exist.
-        path = self.index(file_md5, name)
+        path = self.index(file_hash, name)
         if path is not None:
 
             ## Delete.
@@ -2058,9 +2617,9 @@ class FileStore(Base):
             return path
 
         # Store.
-        md5_relpath = f'{file_md5[:2]}/{file_md5[2:4]}/{file_md5}'
-        md5_path = self.folder + md5_relpath
-        folder = Folder(md5_path)
+        hash_relpath = f'{file_hash[:2]}/{file_hash[2:4]}/{file_hash}'
+        hash_path = self.folder + hash_relpath
+        folder = Folder(hash_path)
         folder.make()
         path = folder + name
 
@@ -2069,10 +2628,15 @@ class FileStore(Base):
             file = File(source)
             file.move(path)
 
+        ## Copy.
+        elif is_path:
+            file = File(source)
+            file.copy(path)
+
         ## Make.
         else:
             file = File(path)
-            file(file_bytes)
+            file(source)
 
         return path
 
@@ -2156,7 +2720,8 @@ class FileStore(Base):
 def compress(
     path: str,
     build_dir: str | None = None,
-    overwrite: bool = True
+    overwrite: bool = True,
+    level: int = 1
 ) -> None:
     """
     Compress file or folder.
@@ -2168,6 +2733,7 @@ def compress(
         - `None`: Work directory.
         - `str`: Use this value.
     overwrite : Whether to overwrite.
+    level : Compression level, from `0` to `9`, the lower the faster.
     """
 
     from zipfile import ZipFile, ZIP_DEFLATED
@@ -2189,7 +2755,7 @@ def compress(
     build_path = join_path(build_dir, build_name)
 
     # Compress.
-    with ZipFile(build_path, mode, ZIP_DEFLATED) as zip_file:
+    with ZipFile(build_path, mode, ZIP_DEFLATED, compresslevel=level, strict_timestamps=False) as zip_file:
 
         ## File.
         if is_file:
@@ -2198,16 +2764,16 @@ def compress(
         ## Folder.
         else:
             dir_path_len = len(folder.path)
-            dirs = os_walk(folder.path)
-            for folder_name, sub_folders_name, files_name in dirs:
-                for sub_folder_name in sub_folders_name:
-                    sub_folder_path = join_path(folder_name, sub_folder_name)
-                    zip_path = sub_folder_path[dir_path_len:]
-                    zip_file.write(sub_folder_path, zip_path)
-                for file_name in files_name:
-                    file_path = join_path(folder_name, file_name)
-                    zip_path = file_path[dir_path_len:]
-                    zip_file.write(file_path, zip_path)
+            dir_paths = [folder.path]
+            while dir_paths:
+                dir_path = dir_paths.pop()
+                with os_scandir(dir_path) as entries:
+                    for entry in entries:
+                        entry_path = f'{dir_path}/{entry.name}'
+                        zip_path = entry_path[dir_path_len:]
+                        zip_file.write(entry_path, zip_path)
+                        if entry.is_dir(follow_symlinks=False):
+                            dir_paths.append(entry_path)
 
 
 def decompress(
@@ -2264,12 +2830,8 @@ def doc_to_docx(path: str, save_path: str | None = None) -> str:
 
     # Parameter.
     if save_path is None:
-        pattern = '.[dD][oO][cC]'
-        save_path = sub(
-            pattern,
-            path.replace('\\', '/'),
-            '.docx'
-        )
+        path_root, _ = os_splitext(path)
+        save_path = path_root.replace('\\', '/') + '.docx'
 
     # Convert.
     cdispatch = Dispatch('Word.Application')
@@ -2280,6 +2842,54 @@ def doc_to_docx(path: str, save_path: str | None = None) -> str:
     return save_path
 
 
+def doc_to_docx_batch(*paths: str | tuple[str, str | None]) -> list[str]:
+    """
+    Batch convert `DOC` file to `DOCX` file, open a new `Word` application once and quit it after.
+
+    Parameters
+    ----------
+    paths : DOC file paths.
+        - `str`: DOC file path, save to DOC file Directory.
+        - `tuple[str, str | None]`: DOC file path and DOCX save file path.
+
+    Returns
+    -------
+    DOCX file paths.
+    """
+
+    # Import.
+    from win32com.client import DispatchEx, CDispatch
+
+    # Convert.
+    cdispatch = DispatchEx('Word.Application')
+    cdispatch.Visible = False
+    cdispatch.DisplayAlerts = 0
+    save_paths = []
+    try:
+        for path in paths:
+
+            ## Parameter.
+            if type(path) == str:
+                save_path = None
+            else:
+                path, save_path = path
+            if save_path is None:
+                path_root, _ = os_splitext(path)
+                save_path = path_root.replace('\\', '/') + '.docx'
+
+            ## Save.
+            document: CDispatch = cdispatch.Documents.Open(path)
+            document.SaveAs(save_path, 16)
+            document.Close()
+            save_paths.append(save_path)
+
+    # Exit application.
+    finally:
+        cdispatch.Quit()
+
+    return save_paths
+
+
 def extract_docx_content(path: str) -> str:
     """
     Extract content from `DOCX` file.
@@ -2296,7 +2906,6 @@ def extract_docx_content(path: str) -> str:
     # Import.
     from docx import Document as docx_document
     from docx.document import Document
-    from docx.text.paragraph import Paragraph
     from docx.table import Table
     from docx.oxml.text.paragraph import CT_P
     from docx.oxml.table import CT_Tbl
@@ -2311,8 +2920,7 @@ def extract_docx_content(path: str) -> str:
 
             ## Text.
             case CT_P():
-                paragraph = Paragraph(child, document)
-                contents.append(paragraph.text)
+                contents.append(child.text)
 
             ## Table.
             case CT_Tbl():
@@ -2321,12 +2929,9 @@ def extract_docx_content(path: str) -> str:
                     [
                         ' | '.join(
                             [
-                                cell.text.strip().replace('\n', ' ')
+                                cell_text.replace('\n', ' ')
                                 for cell in row.cells
-                                if (
-                                    cell.text is not None
-                                    and cell.text.strip() != ''
-                                )
+                                if (cell_text := cell.text.strip()) != ''
                             ]
                         )
                         for row in table.rows
@@ -2358,12 +2963,14 @@ def extract_pdf_content(path: str) -> str:
     from pdfplumber import open as pdfplumber_open
 
     # Extract.
-    document = pdfplumber_open(path)
-    contents = [
-        page.extract_text()
-        for page in document.pages
-    ]
-    document.close()
+    contents = []
+    with pdfplumber_open(path) as document:
+        for page in document.pages:
+            page_text = page.extract_text() or ''
+            contents.append(page_text)
+
+            ## Release page cache.
+            page.close()
 
     ## Join.
     content = '\n'.join(contents)
@@ -2371,9 +2978,17 @@ def extract_pdf_content(path: str) -> str:
     return content
 
 
+# Content extract methods of file suffix.
+_content_extractors: dict[str, Callable[[str], str]] = {
+    '.docx': extract_docx_content,
+    '.pdf': extract_pdf_content
+}
+
+
 def extract_file_content(path: str) -> str:
     """
     Extract content from `DOC` or `DOCX` or `PDF` file.
+    Result is cached by file path, modify time and size.
 
     Parameters
     ----------
@@ -2384,6 +2999,32 @@ def extract_file_content(path: str) -> str:
     Content.
     """
 
+    # Parameter.
+    path = format_path(path)
+    file_stat = os_stat(path)
+
+    # Extract.
+    content = _extract_file_content(path, file_stat.st_mtime_ns, file_stat.st_size)
+
+    return content
+
+
+@lru_cache(128)
+def _extract_file_content(path: str, mtime: int, size: int) -> str:
+    """
+    Extract content from `DOC` or `DOCX` or `PDF` file, cache result.
+
+    Parameters
+    ----------
+    path : File path.
+    mtime : File modify timestamp in nanoseconds, part of cache key.
+    size : File byte size, part of cache key.
+
+    returns
+    -------
+    Content.
+    """
+
     # Parameter.
     _, suffix = os_splitext(path)
     suffix = suffix.lower()
@@ -2392,18 +3033,9 @@ def extract_file_content(path: str) -> str:
         suffix = '.docx'
 
     # Extract.
-    match suffix:
-
-        ## DOCX.
-        case '.docx':
-            content = extract_docx_content(path)
-
-        ## PDF.
-        case '.pdf':
-            content = extract_pdf_content(path)
-
-        ## Throw exception.
-        case _:
-            throw(AssertionError, suffix)
+    extractor = _content_extractors.get(suffix)
+    if extractor is None:
+        throw(AssertionError, suffix)
+    content = extractor(path)
 
     return content
@@ -13,8 +13,8 @@ from typing import Literal, Self, overload
 from collections.abc import Sequence
 from string import digits as string_digits, ascii_letters as string_ascii_letters, punctuation as string_punctuation
 from math import ceil as math_ceil
-from random import Random
-from secrets import randbelow as secrets_randbelow
+from random import Random, SystemRandom
+from secrets import randbelow as secrets_randbelow, token_bytes as secrets_token_bytes
 from threading import get_ident as threading_get_ident
 
 from .rbase import T, Base, Config, throw
@@ -32,6 +32,13 @@ __all__ = (
 )
 
 
+# Random source of operating system, used when no seed.
+_system_random = SystemRandom()
+
+# Power of 10 of common precisions.
+_pow10s = tuple(10 ** index for index in range(19))
+
+
 class RandomConfig(Config):
     """
     Random config type.
@@ -120,6 +127,35 @@ class RandomSeed(Base):
         self.__del__()
 
 
+def _randint(low: int, high: int) -> int:
+    """
+    Random integer, without parameter handle of `randn`.
+
+    Parameters
+    ----------
+    low : Low threshold of random range, range contains threshold.
+    high : High threshold of random range, range contains threshold.
+
+    Returns
+    -------
+    Random integer.
+    """
+
+    # Get random integer.
+    thread_id = threading_get_ident()
+    seed = RandomConfig._rrandom_dict.get(thread_id)
+
+    ## No seed.
+    if seed is None:
+        number = secrets_randbelow(high - low + 1) + low
+
+    ## Seed.
+    else:
+        number = seed.random.randint(low, high)
+
+    return number
+
+
 @overload
 def randn() -> int: ...
 
@@ -173,6 +209,16 @@ def randn(*thresholds: float, precision: int | None = None) -> int | float:
             threshold_high = thresholds[1]
         case _:
             raise ValueError('number of parameter "thresholds" must is 0 or 1 or 2')
+
+    ## Integer.
+    if (
+        precision in (None, 0)
+        and type(threshold_low) == int
+        and type(threshold_high) == int
+    ):
+        number = _randint(threshold_low, threshold_high)
+        return number
+
     if precision is None:
         threshold_low_desimal_digits = digits(threshold_low)[1]
         threshold_high_desimal_digits = digits(threshold_high)[1]
@@ -180,7 +226,10 @@ def randn(*thresholds: float, precision: int | None = None) -> int | float:
         precision = desimal_digits_max
 
     # Get random number.
-    magnifier = 10 ** precision
+    if 0 <= precision < 19:
+        magnifier = _pow10s[precision]
+    else:
+        magnifier = 10 ** precision
     threshold_low = int(threshold_low * magnifier)
     threshold_high = int(threshold_high * magnifier)
 
@@ -222,12 +271,12 @@ def randb(pr: float = 0.5) -> bool:
     # Random probability.
     if 0 < pr < 1:
         high = int(1 / pr * 100)
-        result = randn(1, high) <= 100
+        result = _randint(1, high) <= 100
 
     # Random range.
     elif 1 < pr:
         high = math_ceil(pr)
-        result = randn(1, high) == 1
+        result = _randint(1, high) == 1
 
     # Throw exception.
     else:
@@ -236,6 +285,95 @@ def randb(pr: float = 0.5) -> bool:
     return result
 
 
+def _token_randbelows(range_: int, n: int) -> list[int]:
+    """
+    Batch random integers in range `[0, range_)` from system random bytes.
+    Read random bytes in batch, and use rejection sampling keep uniform distribution.
+
+    Parameters
+    ----------
+    range_ : Range size.
+    n : Number of integers.
+
+    Returns
+    -------
+    Random integers.
+    """
+
+    # Check.
+    if range_ <= 0:
+        throw(ValueError, text='Upper bound must be positive.')
+
+    # Parameter.
+    byte_len = max((range_ - 1).bit_length() + 7 >> 3, 1)
+    value_max = (1 << 8 * byte_len) // range_ * range_
+
+    # Get random integers.
+    numbers: list[int] = []
+    while len(numbers) < n:
+        token = secrets_token_bytes((n - len(numbers)) * byte_len * 2)
+
+        ## Single byte.
+        if byte_len == 1:
+            values = token
+
+        ## Multiple bytes.
+        else:
+            values = (
+                int.from_bytes(token[index:index + byte_len])
+                for index in range(0, len(token), byte_len)
+            )
+
+        numbers.extend(
+            value % range_
+            for value in values
+            if value < value_max
+        )
+    numbers = numbers[:n]
+
+    return numbers
+
+
+def _randints(low: int, high: int, n: int) -> list[int]:
+    """
+    Batch random integers, get random seed of thread once.
+
+    Parameters
+    ----------
+    low : Low threshold of random range, range contains threshold.
+    high : High threshold of random range, range contains threshold.
+    n : Number of integers.
+
+    Returns
+    -------
+    Random integers.
+    """
+
+    # Parameter.
+    thread_id = threading_get_ident()
+    seed = RandomConfig._rrandom_dict.get(thread_id)
+
+    # Get random integers.
+
+    ## No seed.
+    if seed is None:
+        range_ = high - low + 1
+        numbers = [
+            number + low
+            for number in _token_randbelows(range_, n)
+        ]
+
+    ## Seed.
+    else:
+        randint = seed.random.randint
+        numbers = [
+            randint(low, high)
+            for _ in range(n)
+        ]
+
+    return numbers
+
+
 @overload
 def randi(
     data: Sequence[T],
@@ -277,7 +415,7 @@ def randi(
 
         ## One.
         case None:
-            index = randn(data_len - 1)
+            index = _randint(0, data_len - 1)
             result = data[index]
 
         ## Multiple.
@@ -291,22 +429,25 @@ def randi(
                     if multi > data_len:
                         throw(IndexError, multi, data_len)
 
-                    indexes = list(range(data_len))
-                    indexes_randsort = [
-                        indexes.pop(randn(indexes_len - 1))
-                        for indexes_len in range(data_len, data_len - multi, -1)
-                    ]
+                    #### Sample, no seed use system random source.
+                    thread_id = threading_get_ident()
+                    seed = RandomConfig._rrandom_dict.get(thread_id)
+                    if seed is None:
+                        random = _system_random
+                    else:
+                        random = seed.random
+                    indexes = random.sample(range(data_len), multi)
                     result = [
                         data[index]
-                        for index in indexes_randsort
+                        for index in indexes
                     ]
 
                 ### Not unique.
                 case False:
-                    rand_max = data_len - 1
+                    indexes = _randints(0, data_len - 1, multi)
                     result = [
-                        data[randn(rand_max)]
-                        for _ in range(multi)
+                        data[index]
+                        for index in indexes
                     ]
 
     return result
@@ -335,7 +476,21 @@ def randchar(
         char_range += string_punctuation
 
     # Generate.
-    char_list = randi(char_range, length, False)
+    thread_id = threading_get_ident()
+    seed = RandomConfig._rrandom_dict.get(thread_id)
+
+    ## No seed.
+    if seed is None:
+        indexes = _token_randbelows(len(char_range), length)
+        char_list = [
+            char_range[index]
+            for index in indexes
+        ]
+
+    ## Seed.
+    else:
+        char_list = seed.random.choices(char_range, k=length)
+
     chars = ''.join(char_list)
 
     return chars
@@ -354,8 +509,16 @@ def randsort(data: Sequence[T]) -> list[T]:
     Sorted data.
     """
 
+    # Parameter.
+    thread_id = threading_get_ident()
+    seed = RandomConfig._rrandom_dict.get(thread_id)
+    if seed is None:
+        random = _system_random
+    else:
+        random = seed.random
+
     # Random.
-    data_len = len(data)
-    data_randsort = randi(data, data_len)
+    data_randsort = list(data)
+    random.shuffle(data_randsort)
 
     return data_randsort
@@ -10,10 +10,17 @@
 
 
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from types import ModuleType
 from inspect import ismodule
 from functools import wraps as functools_wraps
+from queue import Queue, Empty as QueueEmpty
+from os import cpu_count as os_cpu_count
+from sys import stderr as sys_stderr
+from threading import Thread
+from atexit import unregister as atexit_unregister
+from time import sleep as time_sleep, monotonic as time_monotonic
+from datetime import timedelta as Timedelta
 from enum import StrEnum
 from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -22,7 +29,8 @@ from apscheduler.job import Job
 from reydb import rorm, DatabaseEngine
 from reykit.rtime import now
 
-from .rbase import Base, throw
+from .rbase import Base, throw, catch_exc, at_exit
+from .rwrap import wrap_thread
 
 
 __all__ = (
@@ -60,6 +68,79 @@ class DatabaseORMTableSchedule(rorm.Table):
     note: str = rorm.Field(rorm.types.VARCHAR(500), comment='Schedule note.')
 
 
+# Insert SQL of schedule record, fixed text of DBAPI parameter style, let driver reuse prepared statement.
+# Times use database server clock and time zone, minus the client measured age of event.
+_sql_insert_schedule = (
+    'INSERT INTO "schedule" ("create_time", "update_time", "status", "task", "note")\n'
+    'VALUES (LOCALTIMESTAMP - %(create_age)s, LOCALTIMESTAMP - %(update_age)s, %(status)s, %(task)s, %(note)s)'
+)
+
+
+# Stop sentinel of record queue.
+_records_stop = object()
+
+
+# View stats parameters of schedule record, fixed SQL, build once.
+_views_stats_schedule = [
+    {
+        'table': 'stats_schedule',
+        'items': [
+            {
+                'name': 'count',
+                'select': (
+                    'SELECT COUNT(1)\n'
+                    'FROM "schedule"'
+                ),
+                'comment': 'Schedule count.'
+            },
+            {
+                'name': 'past_day_count',
+                'select': (
+                    'SELECT COUNT(1)\n'
+                    'FROM "schedule"\n'
+                    'WHERE "create_time" > NOW() - INTERVAL \'1 day\''
+                ),
+                'comment': 'Schedule count in the past day.'
+            },
+            {
+                'name': 'past_week_count',
+                'select': (
+                    'SELECT COUNT(1)\n'
+                    'FROM "schedule"\n'
+                    'WHERE "create_time" > NOW() - INTERVAL \'7 days\''
+                ),
+                'comment': 'Schedule count in the past week.'
+            },
+            {
+                'name': 'past_month_count',
+                'select': (
+                    'SELECT COUNT(1)\n'
+                    'FROM "schedule"\n'
+                    'WHERE "create_time" > NOW() - INTERVAL \'30 days\''
+                ),
+                'comment': 'Schedule count in the past month.'
+            },
+            {
+                'name': 'task_count',
+                'select': (
+                    'SELECT COUNT(DISTINCT "task")\n'
+                    'FROM "schedule"'
+                ),
+                'comment': 'Task count.'
+            },
+            {
+                'name': 'last_time',
+                'select': (
+                    'SELECT COALESCE(MAX("update_time"), MAX("create_time"))\n'
+                    'FROM "schedule"'
+                ),
+                'comment': 'Schedule last record time.'
+            }
+        ]
+    }
+]
+
+
 class Schedule(Base):
     """
     Schedule type.
@@ -69,7 +150,7 @@ class Schedule(Base):
 
     def __init__(
         self,
-        max_workers: int = 10,
+        max_workers: int | None = None,
         max_instances: int = 1,
         coalesce: bool = True,
         block: bool = False,
@@ -81,8 +162,9 @@ class Schedule(Base):
 
         Parameters
         ----------
-        max_workers : Maximum number of synchronized executions.
-        max_instances : Maximum number of synchronized executions of tasks with the same ID.
+        max_workers : Maximum number of synchronized executions, threads are created on demand.
+            - `None`: Use `min(32, CPU count + 4)`.
+        max_instances : Maximum number of synchronized executions of tasks with the same ID, still apply within `max_workers`.
         coalesce : Whether to coalesce tasks with the same ID.
         block : Whether to block.
         db_engine : Database engine.
@@ -95,7 +177,12 @@ class Schedule(Base):
         self.db_engine = db_engine
         self.echo = echo
 
+        ## Record queue, write to database in batches, end with stop sentinel.
+        self.records: Queue[dict[str, Any] | object] = Queue()
+
         ## Scheduler.
+        if max_workers is None:
+            max_workers = min(32, (os_cpu_count() or 1) + 4)
         executor = ThreadPoolExecutor(max_workers)
         executors = {'default': executor}
         job_defaults = {
@@ -115,9 +202,14 @@ class Schedule(Base):
         self.scheduler = scheduler
 
         ## Build Database.
+        self._records_writer: Thread | None = None
         if self.db_engine is not None:
             self.build_db()
 
+            ### Record writer, stop by method `close` or at exit.
+            self._records_writer = wrap_thread(self._loop_write_records)()
+            at_exit(self.close)
+
 
     def build_db(self) -> None:
         """
@@ -134,64 +226,7 @@ class Schedule(Base):
         tables = [DatabaseORMTableSchedule]
 
         ## View stats.
-        views_stats = [
-            {
-                'table': 'stats_schedule',
-                'items': [
-                    {
-                        'name': 'count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "schedule"'
-                        ),
-                        'comment': 'Schedule count.'
-                    },
-                    {
-                        'name': 'past_day_count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "schedule"\n'
-                            'WHERE DATE_PART(\'day\', NOW() - "create_time") = 0'
-                        ),
-                        'comment': 'Schedule count in the past day.'
-                    },
-                    {
-                        'name': 'past_week_count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "schedule"\n'
-                            'WHERE DATE_PART(\'day\', NOW() - "create_time") <= 6'
-                        ),
-                        'comment': 'Schedule count in the past week.'
-                    },
-                    {
-                        'name': 'past_month_count',
-                        'select': (
-                            'SELECT COUNT(1)\n'
-                            'FROM "schedule"\n'
-                            'WHERE DATE_PART(\'day\', NOW() - "create_time") <= 29'
-                        ),
-                        'comment': 'Schedule count in the past month.'
-                    },
-                    {
-                        'name': 'task_count',
-                        'select': (
-                            'SELECT COUNT(DISTINCT "task")\n'
-                            'FROM "schedule"'
-                        ),
-                        'comment': 'Task count.'
-                    },
-                    {
-                        'name': 'last_time',
-                        'select': (
-                            'SELECT COALESCE(MAX("update_time"), MAX("create_time"))\n'
-                            'FROM "schedule"'
-                        ),
-                        'comment': 'Schedule last record time.'
-                    }
-                ]
-            }
-        ]
+        views_stats = _views_stats_schedule
 
         # Build.
         self.db_engine.build.build(tables=tables, views_stats=views_stats, skip=True)
@@ -200,6 +235,139 @@ class Schedule(Base):
         self.db_engine.error.build_db()
 
 
+    def _write_records(self, data: list[dict[str, Any]]) -> None:
+        """
+        Insert records to database in one batch, when failed, then insert one by one.
+
+        Parameters
+        ----------
+        data : Record data, times are monotonic clock values.
+        """
+
+        # Parameter.
+
+        ## Convert monotonic time to age of write time.
+        write_time = time_monotonic()
+        data = [
+            {
+                'create_age': Timedelta(seconds=write_time - row['create_time']),
+                'update_age': Timedelta(seconds=write_time - row['update_time']),
+                'status': row['status'],
+                'task': row['task'],
+                'note': row['note']
+            }
+            for row in data
+        ]
+
+        # Use one pooled DBAPI connection, skip SQL handle of execute layer.
+        conn = self.db_engine.engine.raw_connection()
+        try:
+            cursor = conn.cursor()
+
+            ## Batch.
+            try:
+                cursor.executemany(_sql_insert_schedule, data)
+                conn.commit()
+
+            ## One by one.
+            except Exception:
+                conn.rollback()
+                for row in data:
+                    try:
+                        cursor.execute(_sql_insert_schedule, row)
+                        conn.commit()
+                    except Exception:
+                        conn.rollback()
+                        _, exc, stack = catch_exc()
+                        try:
+                            self.db_engine.error.record(exc, stack, 'schedule record')
+                        except Exception:
+                            exc_text, *_ = catch_exc()
+                            print(exc_text, file=sys_stderr)
+
+        # Return to pool.
+        finally:
+            conn.close()
+
+
+    def _loop_write_records(
+        self,
+        batch_size: int = 100,
+        timeout: float = 0.05,
+        retry_delay: float = 0.5,
+        retry_delay_max: float = 60
+    ) -> None:
+        """
+        Loop get records from queue and write to database in batches, used in thread.
+        When get stop sentinel, then write got records and exit.
+
+        Parameters
+        ----------
+        batch_size : Maximum number of records of one batch.
+        timeout : Maximum seconds of wait for next record of one batch.
+        retry_delay : Seconds of first wait before retry write, then double each time.
+        retry_delay_max : Maximum seconds of wait before retry write.
+        """
+
+        # Loop.
+        stopped = False
+        while not stopped:
+
+            ## Get.
+            row = self.records.get()
+            if row is _records_stop:
+                break
+            data = [row]
+            while len(data) < batch_size:
+                try:
+                    row = self.records.get(timeout=timeout)
+                except QueueEmpty:
+                    break
+                if row is _records_stop:
+                    stopped = True
+                    break
+                data.append(row)
+
+            ## Write, retry with backoff, keep thread alive.
+            delay = retry_delay
+            while True:
+                try:
+                    self._write_records(data)
+                except Exception:
+                    exc_text, *_ = catch_exc()
+                    print(exc_text, file=sys_stderr)
+                    time_sleep(delay)
+                    delay = min(delay * 2, retry_delay_max)
+                else:
+                    break
+
+
+    def close(self, timeout: float = 10) -> None:
+        """
+        Shutdown scheduler, then stop record writer thread and wait it write remaining records.
+        After closed, the instance can be garbage collected.
+
+        Parameters
+        ----------
+        timeout : Maximum seconds of wait record writer thread.
+        """
+
+        # Scheduler.
+        if self.scheduler.running:
+            self.scheduler.shutdown()
+
+        # Record writer.
+        if self._records_writer is not None:
+            atexit_unregister(self.close)
+            self.records.put(_records_stop)
+            self._records_writer.join(timeout)
+            self._records_writer = None
+
+        # Echo.
+        if self.echo:
+            print('Close scheduler.')
+
+
     def run(self) -> None:
         """
         Run the scheduler to start.
@@ -254,7 +422,20 @@ class Schedule(Base):
         return jobs
 
 
-    __iter__ = tasks
+    def __iter__(self) -> Iterator[Job]:
+        """
+        Iterate over tasks.
+
+        Returns
+        -------
+        Task iterator.
+        """
+
+        # Get.
+        jobs = self.scheduler.get_jobs()
+        jobs_iter = iter(jobs)
+
+        return jobs_iter
 
 
     def wrap_record_db(
@@ -285,21 +466,8 @@ class Schedule(Base):
             kwargs : Keyword arguments of function.
             """
 
-            # Parameter.
-            nonlocal task, note
-
-            # Status executing.
-            data = {
-                'update_time': ':NOW()',
-                'task': name,
-                'note': note
-            }
-            result = self.db_engine.execute.insert(
-                'schedule',
-                data,
-                returning='id'
-            )
-            id_: int = result.scalar()
+            # Start time, monotonic clock, convert to database time when write.
+            create_time = time_monotonic()
 
             # Try execute.
             try:
@@ -308,27 +476,25 @@ class Schedule(Base):
             # Status occurred error.
             except BaseException:
                 data = {
-                    'id': id_,
-                    'update_time': ':NOW()',
-                    'status': ScheduleStatusEnum.FAIL
+                    'create_time': create_time,
+                    'update_time': time_monotonic(),
+                    'status': ScheduleStatusEnum.FAIL,
+                    'task': name,
+                    'note': note
                 }
-                self.db_engine.execute.update(
-                    'schedule',
-                    data
-                )
+                self.records.put(data)
                 raise
 
             # Status completed.
             else:
                 data = {
-                    'id': id_,
-                    'update_time': ':NOW()',
-                    'status': ScheduleStatusEnum.SUCCESS
+                    'create_time': create_time,
+                    'update_time': time_monotonic(),
+                    'status': ScheduleStatusEnum.SUCCESS,
+                    'task': name,
+                    'note': note
                 }
-                self.db_engine.execute.update(
-                    'schedule',
-                    data
-                )
+                self.records.put(data)
 
         return _task
 
@@ -359,9 +525,6 @@ class Schedule(Base):
             kwargs : Keyword arguments of function.
             """
 
-            # Parameter.
-            nonlocal task
-
             # Execute and echo.
             print(f'Execute | {name}')
             task(*args, **kwargs)
@@ -371,6 +534,29 @@ class Schedule(Base):
         return _task
 
 
+    def _split_plan(self, plan: dict[str, Any] | None) -> tuple[Any, dict[str, Any]]:
+        """
+        Split plan into trigger and trigger keyword arguments, not modify the plan.
+
+        Parameters
+        ----------
+        plan : Plan trigger keyword arguments.
+
+        Returns
+        -------
+        Trigger and trigger keyword arguments.
+        """
+
+        # Split.
+        if plan is None:
+            trigger_args = {}
+        else:
+            trigger_args = plan.copy()
+        trigger = trigger_args.pop('trigger', None)
+
+        return trigger, trigger_args
+
+
     def add_task(
         self,
         task: Callable | ModuleType,
@@ -405,14 +591,7 @@ class Schedule(Base):
         *_, name_default = name_default.rsplit('.', 1)
         if ismodule(task):
             task = getattr(task, 'main')
-        if plan is None:
-            plan = {}
-        trigger = plan.get('trigger')
-        trigger_args = {
-            key: value
-            for key, value in plan.items()
-            if key != 'trigger'
-        }
+        trigger, trigger_args = self._split_plan(plan)
         name = name or name_default
 
         # Database.
@@ -441,10 +620,53 @@ class Schedule(Base):
         return job
 
 
+    def _get_task_id(self, task: Job | str) -> str:
+        """
+        Get task ID, without job store lookup.
+
+        Parameters
+        ----------
+        task : Task instance or ID.
+
+        Returns
+        -------
+        Task ID.
+        """
+
+        # Get.
+        if isinstance(task, Job):
+            task_id = task.id
+        else:
+            task_id = task
+
+        return task_id
+
+
+    def _get_task_name(self, task: Job | str) -> str:
+        """
+        Get task name.
+
+        Parameters
+        ----------
+        task : Task instance or ID.
+
+        Returns
+        -------
+        Task name.
+        """
+
+        # Get.
+        if not isinstance(task, Job):
+            task = self.scheduler.get_job(task)
+        task_name = task.name
+
+        return task_name
+
+
     def update_task(
         self,
         task: Job | str,
-        plan: dict[str, Any],
+        plan: dict[str, Any] | None = None,
         args: tuple | None = None,
         kwargs: dict[str, Any] | None = None,
         note: str | None = None
@@ -456,30 +678,18 @@ class Schedule(Base):
         ----------
         task : Task instance or ID.
         plan : Plan trigger keyword arguments.
+            - `None`: Not update plan.
         args : Task position arguments.
         kwargs : Task keyword arguments.
         note : Task note.
         """
 
         # Parameter.
-        if type(task) == Job:
-            task_id = task.id
-            task_name = task.name
-        else:
-            task_id = task
-            task = self.scheduler.get_job(task_id)
-            task_name = task.name
-        if plan is None:
-            plan = {}
-        trigger = plan.get('trigger')
-        trigger_args = {
-            key: value
-            for key, value in plan.items()
-            if key != 'trigger'
-        }
+        task_id = self._get_task_id(task)
 
         # Modify plan.
-        if plan != {}:
+        if plan:
+            trigger, trigger_args = self._split_plan(plan)
             self.scheduler.reschedule_job(
                 task_id,
                 trigger=trigger,
@@ -487,18 +697,17 @@ class Schedule(Base):
             )
 
         # Modify arguments.
-        if (
-            args != ()
-            or kwargs != {}
-        ):
-            self.scheduler.modify_job(
-                task_id,
-                args=args,
-                kwargs=kwargs
-            )
+        changes = {}
+        if args is not None:
+            changes['args'] = args
+        if kwargs is not None:
+            changes['kwargs'] = kwargs
+        if changes:
+            self.scheduler.modify_job(task_id, **changes)
 
         # Echo.
         if self.echo:
+            task_name = self._get_task_name(task)
             print(f'Update | {task_name}')
 
 
@@ -515,13 +724,9 @@ class Schedule(Base):
         """
 
         # Parameter.
-        if type(task) == Job:
-            task_id = task.id
-            task_name = task.name
-        else:
-            task_id = task
-            task = self.scheduler.get_job(task_id)
-            task_name = task.name
+        task_id = self._get_task_id(task)
+        if self.echo:
+            task_name = self._get_task_name(task)
 
         # Remove.
         self.scheduler.remove_job(task_id)
@@ -544,19 +749,14 @@ class Schedule(Base):
         """
 
         # Parameter.
-        if type(task) == Job:
-            task_id = task.id
-            task_name = task.name
-        else:
-            task_id = task
-            task = self.scheduler.get_job(task_id)
-            task_name = task.name
+        task_id = self._get_task_id(task)
 
         # Pause.
         self.scheduler.pause_job(task_id)
 
         # Echo.
         if self.echo:
+            task_name = self._get_task_name(task)
             print(f'Stop   | {task_name}')
 
 
@@ -573,17 +773,12 @@ class Schedule(Base):
         """
 
         # Parameter.
-        if type(task) == Job:
-            task_id = task.id
-            task_name = task.name
-        else:
-            task_id = task
-            task = self.scheduler.get_job(task_id)
-            task_name = task.name
+        task_id = self._get_task_id(task)
 
         # Resume.
         self.scheduler.resume_job(task_id)
 
         # Echo.
         if self.echo:
+            task_name = self._get_task_name(task)
             print(f'Start  | {task_name}')
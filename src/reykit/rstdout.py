@@ -15,8 +15,9 @@ import sys
 from io import TextIOWrapper
 from os import devnull as os_devnull, isatty as os_isatty, get_terminal_size as os_get_terminal_size
 from os.path import abspath as os_abspath
+from time import monotonic as time_monotonic
 
-from .rbase import T, Config, get_stack_param, get_varname
+from .rbase import T, Config, get_varname
 
 
 __all__ = (
@@ -56,6 +57,10 @@ class StdoutConfig(Config):
     # Added print position.
     _added_print_position: set = set()
 
+    # Terminal size cache, stream number to size and get time.
+    _terminal_size_cache: dict[int, tuple[tuple[int, int] | None, float]] = {}
+    _terminal_size_ttl: Final[float] = 0.5
+
 
 def get_terminal_size(
     stream: Literal['stdin', 'stdout', 'stderr'] = 'stdout',
@@ -67,10 +72,11 @@ def get_terminal_size(
     Parameters
     ----------
     stream : Standard stream type.
+    default : Default value when stream is not terminal.
 
     Returns
     -------
-    Column and line display character count.
+    Column and line display character count, cache `0.5` seconds.
     """
 
     # Parameter.
@@ -82,12 +88,27 @@ def get_terminal_size(
         case 'stderr':
             stream = 2
 
+    # Cache.
+    now_time = time_monotonic()
+    cache = StdoutConfig._terminal_size_cache.get(stream)
+    if (
+        cache is not None
+        and now_time - cache[1] < StdoutConfig._terminal_size_ttl
+    ):
+        terminal_size = cache[0]
+
     # Get.
-    exist = os_isatty(stream)
-    if exist:
-        terminal_size = os_get_terminal_size(stream)
-        terminal_size = tuple(terminal_size)
     else:
+        exist = os_isatty(stream)
+        if exist:
+            terminal_size = os_get_terminal_size(stream)
+            terminal_size = tuple(terminal_size)
+        else:
+            terminal_size = None
+        StdoutConfig._terminal_size_cache[stream] = (terminal_size, now_time)
+
+    ## Not terminal.
+    if terminal_size is None:
         terminal_size = default
 
     return terminal_size
@@ -251,13 +272,19 @@ def modify_print(preprocess: Callable[[str], str] | None) -> None:
     """
 
 
-    def write(__s: str) -> int | None:
+    def write(
+        __s: str,
+        _preprocess: Callable[[str], str | None] = preprocess,
+        _write: Callable[[str], int] = StdoutConfig._io_stdout_write
+    ) -> int | None:
         """
         Modified standard output write method.
 
         Parameters
         ----------
         __s : Write text.
+        _preprocess : Bound preprocess function, local variable access.
+        _write : Bound original write method, local variable access.
 
         Returns
         -------
@@ -265,11 +292,11 @@ def modify_print(preprocess: Callable[[str], str] | None) -> None:
         """
 
         # Preprocess.
-        __s = preprocess(__s)
+        __s = _preprocess(__s)
 
         # Write.
-        if type(__s) == str:
-            write_len = StdoutConfig._io_stdout_write(__s)
+        if __s.__class__ is str:
+            write_len = _write(__s)
             return write_len
 
 
@@ -316,18 +343,21 @@ def add_print_position() -> None:
         """
 
         # Parameter.
-        stack_params = get_stack_param('full', 3)
-        stack_floor = stack_params[-1]
+
+        ## Frame of print caller, skip this function and write method.
+        frame = sys._getframe(2)
+        code = frame.f_code
 
         ## Compatible 'echo'.
         if (
-            stack_floor['filename'] == StdoutConfig._path_rstdout
-            and stack_floor['name'] == 'echo'
+            code.co_name == 'echo'
+            and code.co_filename == path_rstdout
         ):
-            stack_floor = stack_params[-2]
+            frame = frame.f_back
+            code = frame.f_code
 
         # Add.
-        position = 'File "%s", line %s' % (stack_floor['filename'], stack_floor['lineno'])
+        position = 'File "%s", line %s' % (code.co_filename, frame.f_lineno)
 
         # Added.
         if position in StdoutConfig._added_print_position:
@@ -340,4 +370,5 @@ def add_print_position() -> None:
 
 
     # Modify.
+    path_rstdout = StdoutConfig._path_rstdout
     modify_print(preprocess)